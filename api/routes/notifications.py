@@ -615,8 +615,8 @@ def list_notifications(user_context):
                 })
             
             # Convert to notification entities
+            # Only the paginated slice is transformed; sort/skip/limit ran in the query
             notifications = []
-            print(f"DEBUG: Converting {len(pagination_result.items)} items to notification entities")
             for item in pagination_result.items:
                 try:
                     # Convert MongoDB document to Notification entity
@@ -647,15 +647,10 @@ def list_notifications(user_context):
                         "schema_version": item.get("schemaVersion", 1)
                     }
                     
-                    from models.entities import Notification
-                    print(f"DEBUG: Creating notification with data keys: {list(notification_data.keys())}")
-                    notification = Notification(**notification_data)
-                    notifications.append(notification)
-                    print(f"DEBUG: Successfully created notification {notification.id}")
+                    notifications.append(Notification(**notification_data))
                     
                 except Exception as e:
-                    print(f"DEBUG: Failed to parse notification {item.get('id')}: {str(e)}")
-                    print(f"DEBUG: Item data: {item}")
+                    logger.warning(f"Failed to parse notification {item.get('id')}: {str(e)}")
                     continue
             
             # Build HAL collection response
@@ -365,15 +365,14 @@ class AuditService:
                     )
                     audit_logs = result.items
                 else:
-                    # Get all matching records
+                    # Get all matching records sorted by timestamp descending
                     audit_logs = self.mongo_service.find_by_org(
                         collection=self.collection_name,
                         org_id=org_id,
                         filters=mongo_filters,
-                        include_deleted=False
+                        include_deleted=False,
+                        sort=[("timestamp", -1)]
                     )
-                    # Sort by timestamp descending
-                    audit_logs.sort(key=lambda x: x.get("timestamp", datetime.min), reverse=True)
                 
                 logger.info(
                     "Audit logs exported successfully",
@@ -11,7 +11,7 @@ import os
 import jwt
 import bcrypt
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
 from opentelemetry import trace
@@ -179,6 +179,42 @@ ywIDAQAB
                 logger.error(f"Password verification error: {str(e)}")
                 return False
     
+    def _build_access_payload(
+        self,
+        user_id: str,
+        org_id: str,
+        email: Optional[str],
+        name: Optional[str],
+        permissions: List[str],
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the access token claims without signing them.
+        
+        Args:
+            user_id: Subject user ID
+            org_id: Organization the token is bound to
+            email: User email address
+            name: User display name
+            permissions: Effective user permissions
+            now: Issue time (defaults to current UTC time)
+            
+        Returns:
+            Access token payload
+        """
+        now = now or datetime.now(timezone.utc)
+        
+        return {
+            "sub": user_id,
+            "org_id": org_id,
+            "email": email,
+            "name": name,
+            "permissions": permissions,
+            "iat": now,
+            "exp": now + timedelta(minutes=self.access_token_expire_minutes),
+            "type": "access"
+        }
+    
     def generate_tokens(self, user: User) -> Dict[str, Any]:
         """
         Generate access and refresh tokens for a user.
@@ -197,20 +233,18 @@ ywIDAQAB
             })
             
             now = datetime.now(timezone.utc)
-            access_exp = now + timedelta(minutes=self.access_token_expire_minutes)
             refresh_exp = now + timedelta(days=self.refresh_token_expire_days)
             
             # Access token payload
-            access_payload = {
-                "sub": user.id,
-                "org_id": user.organization_id,
-                "email": user.email,
-                "name": user.name,
-                "permissions": user.permissions,
-                "iat": now,
-                "exp": access_exp,
-                "type": "access"
-            }
+            access_payload = self._build_access_payload(
+                user.id,
+                user.organization_id,
+                user.email,
+                user.name,
+                user.permissions,
+                now
+            )
+            access_exp = access_payload["exp"]
             
             # Refresh token payload
             refresh_payload = {
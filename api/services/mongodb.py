@@ -40,14 +40,20 @@ class PaginationResult:
 class MongoDBService:
     """MongoDB service with multi-tenant operations and connection pooling."""
     
-    def __init__(self, connection_string: str = None, database_name: str = None):
-        """Initialize MongoDB service with connection pooling."""
+    def __init__(self, connection_string: str = None, database_name: str = None,
+                 client: Optional[MongoClient] = None):
+        """Initialize MongoDB service with connection pooling.
+        
+        An existing client can be injected to share its connection pool; the
+        service then never closes it.
+        """
         self.connection_string = connection_string or os.getenv(
             'MONGODB_URI', 
             'mongodb://localhost:27017/sos_cidadao_dev'
         )
         self.database_name = database_name or os.getenv('MONGODB_DATABASE', 'sos_cidadao_dev')
-        self._client: Optional[MongoClient] = None
+        self._client: Optional[MongoClient] = client
+        self._owns_client = client is None
         self._database: Optional[Database] = None
         
         # Connection pool settings
@@ -72,6 +78,7 @@ class MongoDBService:
                     retryWrites=True,
                     retryReads=True
                 )
+                self._owns_client = True
                 # Test connection
                 self._client.admin.command('ping')
                 logger.info("MongoDB connection established successfully")
@@ -95,10 +102,11 @@ class MongoDBService:
     def close_connection(self) -> None:
         """Close MongoDB connection."""
         if self._client:
-            self._client.close()
+            if self._owns_client:
+                self._client.close()
+                logger.info("MongoDB connection closed")
             self._client = None
             self._database = None
-            logger.info("MongoDB connection closed")
     
     def health_check(self) -> Dict[str, Any]:
         """Check MongoDB connection health."""
@@ -202,13 +210,23 @@ class MongoDBService:
             raise
     
     def find_by_org(self, collection: str, org_id: str, filters: Dict = None, 
-                    include_deleted: bool = False) -> List[Dict]:
-        """Find documents by organization with optional filters."""
+                    include_deleted: bool = False, sort: List[Tuple[str, int]] = None,
+                    limit: int = 0, skip: int = 0) -> List[Dict]:
+        """Find documents by organization with optional filters, sorting and paging."""
         try:
             query = self._build_org_query(org_id, filters, include_deleted)
             collection_obj = self.get_collection(collection)
             
-            documents = list(collection_obj.find(query))
+            # Sort and page on the server so only the returned slice is converted
+            cursor = collection_obj.find(query)
+            if sort:
+                cursor = cursor.sort(sort)
+            if skip:
+                cursor = cursor.skip(skip)
+            if limit:
+                cursor = cursor.limit(limit)
+            
+            documents = list(cursor)
             
             # Convert ObjectId to string for JSON serialization
             for doc in documents:
@@ -249,7 +267,34 @@ class MongoDBService:
             logger.error(f"Failed to find document {doc_id} in {collection}: {e}")
             raise
     
-    def update_by_org(self, collection: str, org_id: str, doc_id: str, 
+    def partition_ids_by_org(self, collection: str, org_id: str,
+                             doc_ids: List[str]) -> Tuple[List[str], List[str]]:
+        """Split document IDs into (found, missing) for an organization in a single query."""
+        try:
+            object_ids = []
+            for doc_id in doc_ids:
+                try:
+                    object_ids.append(self._validate_object_id(doc_id))
+                except ValueError:
+                    # Malformed IDs can never match; they end up in the missing partition
+                    continue
+            
+            query = self._build_org_query(org_id, {"_id": {"$in": object_ids}})
+            collection_obj = self.get_collection(collection)
+            
+            found_ids = {str(doc["_id"]) for doc in collection_obj.find(query, {"_id": 1})}
+            
+            found = [doc_id for doc_id in doc_ids if doc_id in found_ids]
+            missing = [doc_id for doc_id in doc_ids if doc_id not in found_ids]
+            
+            logger.debug(f"Partitioned {len(doc_ids)} ids in {collection}: {len(found)} found, {len(missing)} missing")
+            return found, missing
+        
+        except Exception as e:
+            logger.error(f"Failed to partition ids in {collection}: {e}")
+            raise
+    
+    def update_by_org(self, collection: str, org_id: str, doc_id: str,
                      updates: Dict, user_id: str) -> bool:
         """Update a document by organization and ID."""
         try:
@@ -372,12 +417,29 @@ class MongoDBService:
             logger.error(f"Failed to count documents in {collection}: {e}")
             raise
     
+    def _build_org_pipeline(self, org_id: str, pipeline: List[Dict]) -> List[Dict]:
+        """Build organization-scoped pipeline with the scope in the first $match stage."""
+        org_scope = {"organizationId": org_id, "deletedAt": None}
+        
+        # Fold organization scope into a leading $match so the caller's filter
+        # and the tenant scope are evaluated together against the compound indexes
+        if pipeline and "$match" in pipeline[0]:
+            caller_match = pipeline[0]["$match"]
+            
+            # A caller condition on a scope field must be kept, not overwritten
+            if org_scope.keys() & caller_match.keys():
+                scoped_match = {"$and": [caller_match, org_scope]}
+            else:
+                scoped_match = {**caller_match, **org_scope}
+            
+            return [{"$match": scoped_match}] + pipeline[1:]
+        
+        return [{"$match": org_scope}] + pipeline
+    
     def aggregate_by_org(self, collection: str, org_id: str, pipeline: List[Dict]) -> List[Dict]:
         """Run aggregation pipeline with organization scoping."""
         try:
-            # Add organization match stage at the beginning
-            org_match = {"$match": {"organizationId": org_id, "deletedAt": None}}
-            pipeline.insert(0, org_match)
+            pipeline = self._build_org_pipeline(org_id, pipeline)
             
             collection_obj = self.get_collection(collection)
             results = list(collection_obj.aggregate(pipeline))
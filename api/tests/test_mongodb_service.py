@@ -32,6 +32,18 @@ class TestMongoDBService:
         assert 'version' in health
         assert health['database'] == 'sos_cidadao_test'
     
+    def test_injected_client_is_shared(self, mongodb_client, test_database_name):
+        """Test that an injected client is reused and left open on close."""
+        service = MongoDBService(database_name=test_database_name, client=mongodb_client)
+        
+        assert service.client is mongodb_client
+        assert service.database.name == test_database_name
+        
+        service.close_connection()
+        
+        # The owner of the injected client can keep using it
+        assert mongodb_client.admin.command('ping')['ok'] == 1
+    
     def test_create_document(self, mongodb_service, clean_database, sample_organization_data):
         """Test document creation with organization scoping."""
         user_id = str(ObjectId())
@@ -101,6 +113,24 @@ class TestMongoDBService:
         not_found = mongodb_service.find_one_by_org("organizations", wrong_org_id, doc_id)
         assert not_found is None
     
+    def test_partition_ids_by_org(self, mongodb_service, clean_database, sample_notification_data):
+        """Test partitioning IDs into own-organization and missing in one scan."""
+        user_id = str(ObjectId())
+        org_id = sample_notification_data["organization_id"]
+        
+        own_id = mongodb_service.create("notifications", sample_notification_data.copy(), user_id)
+        
+        other_org_data = sample_notification_data.copy()
+        other_org_data["organization_id"] = str(ObjectId())
+        other_id = mongodb_service.create("notifications", other_org_data, user_id)
+        
+        found, missing = mongodb_service.partition_ids_by_org(
+            "notifications", org_id, [own_id, other_id, "invalid-object-id"]
+        )
+        
+        assert found == [own_id]
+        assert missing == [other_id, "invalid-object-id"]
+    
     def test_update_by_org(self, mongodb_service, clean_database, sample_organization_data):
         """Test updating document by organization and ID."""
         user_id = str(ObjectId())
@@ -185,6 +215,22 @@ class TestMongoDBService:
         assert page3.has_next is False
         assert page3.has_prev is True
     
+    def test_find_by_org_sort_and_paging(self, mongodb_service, clean_database, sample_notification_data):
+        """Test server-side sorting and paging in find_by_org."""
+        user_id = str(ObjectId())
+        org_id = sample_notification_data["organization_id"]
+        
+        for i in range(5):
+            notification_data = sample_notification_data.copy()
+            notification_data["severity"] = i + 1
+            mongodb_service.create("notifications", notification_data, user_id)
+        
+        docs = mongodb_service.find_by_org(
+            "notifications", org_id, sort=[("severity", -1)], limit=2, skip=1
+        )
+        
+        assert [doc["severity"] for doc in docs] == [4, 3]
+    
     def test_count_by_org(self, mongodb_service, clean_database, sample_notification_data):
         """Test counting documents by organization."""
         user_id = str(ObjectId())
@@ -278,6 +324,37 @@ class TestMongoDBService:
         assert severity_counts[4] == 2
         assert severity_counts[5] == 1
     
+    def test_org_pipeline_scope_in_first_match(self, mongodb_service):
+        """Test organization scope is folded into the leading $match stage."""
+        org_id = str(ObjectId())
+        pipeline = [
+            {"$match": {"severity": 3}},
+            {"$project": {"title": 1}}
+        ]
+        
+        scoped = mongodb_service._build_org_pipeline(org_id, pipeline)
+        
+        assert len(scoped) == 2
+        assert scoped[0] == {"$match": {"severity": 3, "organizationId": org_id, "deletedAt": None}}
+        assert scoped[1] == {"$project": {"title": 1}}
+        
+        # Caller's pipeline must not be mutated
+        assert pipeline[0] == {"$match": {"severity": 3}}
+        
+        # Pipelines without a leading $match get a scope stage prepended
+        unscoped = [{"$group": {"_id": "$severity"}}]
+        scoped = mongodb_service._build_org_pipeline(org_id, unscoped)
+        assert scoped[0] == {"$match": {"organizationId": org_id, "deletedAt": None}}
+        assert len(unscoped) == 1
+        
+        # Caller conditions on scope fields are combined with $and, never replaced
+        overlapping = [{"$match": {"deletedAt": {"$ne": None}, "severity": 3}}]
+        scoped = mongodb_service._build_org_pipeline(org_id, overlapping)
+        assert scoped[0] == {"$match": {"$and": [
+            {"deletedAt": {"$ne": None}, "severity": 3},
+            {"organizationId": org_id, "deletedAt": None}
+        ]}}
+    
     def test_invalid_object_id(self, mongodb_service, clean_database):
         """Test handling of invalid ObjectId."""
         org_id = str(ObjectId())
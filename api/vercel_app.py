@@ -4,10 +4,7 @@ Optimized for serverless deployment with connection pooling and caching.
 """
 
 import os
-from app import create_app
-
-# Create the Flask application instance
-app = create_app()
+from app import app
 
 # Vercel expects the WSGI application to be named 'app'
 # This is the entry point for Vercel serverless functions
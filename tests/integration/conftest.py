@@ -0,0 +1,70 @@
+"""
+Pytest configuration for integration tests.
+"""
+
+import os
+import json
+import pytest
+from pathlib import Path
+from types import MappingProxyType
+
+
+# Production deployment checks grouped by the external service they hit, so
+# `pytest -n auto --dist=loadgroup` runs each group on its own worker
+PRODUCTION_DEPLOYMENT_MODULE = "test_production_deployment.py"
+PRODUCTION_SERVICE_GROUPS = (
+    ("mongodb", "production-mongodb"),
+    ("database", "production-mongodb"),
+    ("migration", "production-mongodb"),
+    ("redis", "production-redis"),
+    ("amqp", "production-amqp"),
+)
+
+VERCEL_CONFIG_FILE = Path(__file__).resolve().parents[2] / "vercel.json"
+
+
+# Leave the production module out of collection when asked, so it isn't even imported
+collect_ignore = []
+if os.getenv("SKIP_PRODUCTION_TESTS") == "1":
+    collect_ignore.append(PRODUCTION_DEPLOYMENT_MODULE)
+
+
+@pytest.fixture(scope="session")
+def vercel_config():
+    """Parsed vercel.json, read once per session and exposed read-only."""
+    return MappingProxyType(json.loads(VERCEL_CONFIG_FILE.read_bytes()))
+
+
+@pytest.fixture(scope="session")
+def auth_tokens():
+    """Mock bearer tokens for the security test users, built once per session.
+    
+    Read-only, since the session-wide mapping is shared by every test.
+    """
+    return MappingProxyType({
+        "admin": "test_token_admin_security-test_com",
+        "user": "test_token_user_security-test_com"
+    })
+
+
+@pytest.fixture(scope="session")
+def auth_headers(auth_tokens):
+    """Read-only Authorization headers for each security test user; copy before mutating."""
+    return MappingProxyType({
+        role: MappingProxyType({"Authorization": f"Bearer {token}"})
+        for role, token in auth_tokens.items()
+    })
+
+
+def pytest_collection_modifyitems(config, items):
+    """Assign xdist groups to production deployment tests."""
+    for item in items:
+        if PRODUCTION_DEPLOYMENT_MODULE not in item.nodeid:
+            continue
+        
+        name = item.name.lower()
+        group = next(
+            (group for keyword, group in PRODUCTION_SERVICE_GROUPS if keyword in name),
+            "production-http"
+        )
+        item.add_marker(pytest.mark.xdist_group(group))
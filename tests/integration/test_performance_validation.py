@@ -5,6 +5,9 @@ Comprehensive performance testing including load testing,
 response time validation, and resource usage monitoring.
 """
 
+import os
+import json
+import math
 import pytest
 import time
 import threading
@@ -13,9 +16,42 @@ import statistics
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Tuple
 import concurrent.futures
+from collections import defaultdict
+from types import MappingProxyType
 import psutil
 import requests
 from unittest.mock import patch
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.write_concern import WriteConcern
+from werkzeug.test import EnvironBuilder
+
+from api.services.mongodb import MongoDBService
+
+
+# Throwaway fixture data can skip write acknowledgement; prod-like runs keep w=1
+FIXTURE_WRITE_CONCERN = WriteConcern(w=0) if os.getenv("PERF_FIXTURE_FAST") == "1" else WriteConcern(w=1)
+
+
+def _percentiles(samples: List[float], *quantiles: float) -> List[float]:
+    """Nearest-rank percentiles taken from a single sort of the samples."""
+    ordered = sorted(samples)
+    return [ordered[max(0, math.ceil(q * len(ordered)) - 1)] for q in quantiles]
+
+
+@pytest.fixture(scope="session")
+def perf_executor():
+    """Thread pool shared by the concurrent tests so workers are not respawned per test."""
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=64)
+    yield executor
+    executor.shutdown(wait=False)
+
+
+@pytest.fixture
+def mongo_service():
+    """MongoDB service owning its client, closed after the test so no client leaks."""
+    service = MongoDBService()
+    yield service
+    service.close_connection()
 
 
 class TestPerformanceValidation:
@@ -34,17 +70,40 @@ class TestPerformanceValidation:
         self.memory_threshold = 512         # MB
         self.cpu_threshold = 80             # percentage
         
-        # Create test data for performance testing
+        # Resolve auth once; read-only so tests can't mutate the shared headers
+        token = self._get_auth_token("user0@perf-test.com")
+        self.auth_headers = MappingProxyType({"Authorization": f"Bearer {token}"})
+        
+        # Attach auth once to the in-process client instead of passing headers per call
+        self.client.environ_base["HTTP_AUTHORIZATION"] = self.auth_headers["Authorization"]
+        
+        # Create org and users; the notification set is seeded on demand by perf_notifications
         self._create_performance_test_data()
+        
+        yield
+        
+        self.client.environ_base.pop("HTTP_AUTHORIZATION", None)
+    
+    @pytest.fixture
+    def perf_notifications(self, setup_performance_test_environment):
+        """Seed the 1000-notification dataset for tests that read it.
+        
+        Requests the setup fixture explicitly, since seeding reads the users
+        and reference time it creates.
+        """
+        self._create_performance_notifications()
     
     def _create_performance_test_data(self):
         """Create test data for performance testing."""
+        # One reference time for every fixture document
+        now = self._fixture_now = datetime.utcnow()
+        
         # Create test organization
         self.test_org_id = "perf_test_org"
         self.db.organizations.insert_one({
             "_id": self.test_org_id,
             "name": "Performance Test Organization",
-            "createdAt": datetime.utcnow(),
+            "createdAt": now,
             "schemaVersion": 1
         })
         
@@ -57,118 +116,132 @@ class TestPerformanceValidation:
                 "email": f"user{i}@perf-test.com",
                 "name": f"Performance User {i}",
                 "permissions": ["notification:read", "notification:create"],
-                "createdAt": datetime.utcnow(),
+                "createdAt": now,
                 "schemaVersion": 1
             }
             self.test_users.append(user)
-            self.db.users.insert_one(user)
-        
-        # Create test notifications for pagination testing
-        self.test_notifications = []
-        for i in range(1000):
-            notification = {
+        self._fixture_collection("users").insert_many(self.test_users, ordered=False)
+        self._confirm_seed("users", len(self.test_users))
+    
+    def _create_performance_notifications(self):
+        """Create notifications for pagination and query testing, one minute apart."""
+        now = self._fixture_now
+        num_notifications = 1000
+        timestamps = [now - timedelta(minutes=i) for i in range(num_notifications)]
+        creators = [user["_id"] for user in self.test_users]
+        self.test_notifications = [
+            {
                 "_id": f"perf_notif_{i:04d}",
                 "organizationId": self.test_org_id,
                 "title": f"Performance Test Notification {i}",
                 "body": f"This is performance test notification number {i} with some content to test response sizes.",
                 "severity": i % 6,
                 "status": "received",
-                "createdBy": f"perf_user_{i % 10}",
-                "createdAt": datetime.utcnow() - timedelta(minutes=i),
-                "updatedAt": datetime.utcnow() - timedelta(minutes=i),
+                "createdBy": creators[i % len(creators)],
+                "createdAt": timestamps[i],
+                "updatedAt": timestamps[i],
                 "deletedAt": None,
                 "schemaVersion": 1
             }
-            self.test_notifications.append(notification)
+            for i in range(num_notifications)
+        ]
+        
+        # Single unordered bulk insert lets the server apply writes without per-batch round trips
+        self._fixture_collection("notifications").insert_many(self.test_notifications, ordered=False)
+        self._confirm_seed("notifications", num_notifications)
         
-        # Insert notifications in batches for better performance
-        batch_size = 100
-        for i in range(0, len(self.test_notifications), batch_size):
-            batch = self.test_notifications[i:i + batch_size]
-            self.db.notifications.insert_many(batch)
+        # Build the indexes the query tests rely on once, after the bulk load
+        self.db.notifications.create_indexes([
+            IndexModel([("organizationId", ASCENDING), ("createdAt", DESCENDING)]),
+            IndexModel([("organizationId", ASCENDING), ("severity", ASCENDING)]),
+        ])
+    
+    def _fixture_collection(self, name: str):
+        """Return a collection handle using the fixture write concern."""
+        return self.db.get_collection(name, write_concern=FIXTURE_WRITE_CONCERN)
+    
+    def _confirm_seed(self, name: str, expected: int, timeout: float = 5.0):
+        """Wait until unacknowledged (w=0) fixture writes to a collection are visible.
+        
+        With w=1 insert_many has already been acknowledged, so this costs nothing.
+        A ping can't stand in for the check: w=0 writes may go out on other
+        pooled sockets and still be pending when it returns.
+        """
+        if FIXTURE_WRITE_CONCERN.acknowledged:
+            return
+        
+        deadline = time.monotonic() + timeout
+        while self.db[name].count_documents({"organizationId": self.test_org_id}) < expected:
+            assert time.monotonic() < deadline, f"Seeded {name} not visible after {timeout}s"
+            time.sleep(0.01)
     
-    def test_api_response_times(self):
+    @pytest.mark.parametrize("endpoint,method,data", [
+        ("/api/health", "GET", None),
+        ("/api", "GET", None),
+        ("/api/notifications", "GET", None),
+        ("/api/notifications?page=1&limit=20", "GET", None),
+        ("/api/notifications", "POST", {
+            "title": "Performance Test",
+            "body": "Testing response time",
+            "severity": 2
+        })
+    ])
+    @pytest.mark.usefixtures("perf_notifications")
+    def test_api_response_times(self, perf_executor, endpoint, method, data):
         """Test API response times under normal load."""
-        token = self._get_auth_token("user0@perf-test.com")
-        headers = {"Authorization": f"Bearer {token}"}
-        
-        # Test different endpoints
-        endpoints_to_test = [
-            ("/api/health", "GET", None),
-            ("/api", "GET", None),
-            ("/api/notifications", "GET", None),
-            ("/api/notifications?page=1&limit=20", "GET", None),
-            ("/api/notifications", "POST", {
-                "title": "Performance Test",
-                "body": "Testing response time",
-                "severity": 2
-            })
-        ]
+        samples_per_endpoint = 10
         
-        response_times = {}
+        def time_request(_idx):
+            start_ns = time.perf_counter_ns()
+            if method == "GET":
+                response = self.client.get(endpoint)
+            else:
+                response = self.client.post(endpoint, json=data)
+            return response.status_code, (time.perf_counter_ns() - start_ns) / 1e9
         
-        for endpoint, method, data in endpoints_to_test:
-            times = []
-            
-            # Test each endpoint multiple times
-            for _ in range(10):
-                start_time = time.time()
-                
-                if method == "GET":
-                    response = self.client.get(endpoint, headers=headers)
-                else:
-                    response = self.client.post(endpoint, json=data, headers=headers)
-                
-                end_time = time.time()
-                response_time = end_time - start_time
-                
-                # Verify response is successful
-                assert response.status_code in [200, 201], f"Failed request to {endpoint}"
-                
-                times.append(response_time)
-                time.sleep(0.1)  # Small delay between requests
-            
-            # Calculate statistics
-            avg_time = statistics.mean(times)
-            max_time = max(times)
-            min_time = min(times)
-            p95_time = statistics.quantiles(times, n=20)[18]  # 95th percentile
-            
-            response_times[endpoint] = {
-                "average": avg_time,
-                "maximum": max_time,
-                "minimum": min_time,
-                "p95": p95_time,
-                "samples": len(times)
-            }
-            
-            # Assert performance thresholds
-            assert avg_time < self.response_time_threshold, f"{endpoint} average response time too slow: {avg_time:.2f}s"
-            assert p95_time < self.response_time_threshold * 1.5, f"{endpoint} 95th percentile too slow: {p95_time:.2f}s"
+        if method == "GET":
+            # Read-only endpoints can be sampled concurrently
+            results = list(perf_executor.map(time_request, range(samples_per_endpoint)))
+        else:
+            # Creates stay serial so the samples don't contend on the same writes
+            results = [time_request(i) for i in range(samples_per_endpoint)]
+        
+        # Verify responses are successful
+        for status_code, _ in results:
+            assert status_code in [200, 201], f"Failed request to {method} {endpoint}"
+        
+        times = [elapsed for _, elapsed in results]
+        
+        # Calculate statistics
+        avg_time = statistics.mean(times)
+        max_time = max(times)
+        p50_time, p95_time, p99_time = _percentiles(times, 0.50, 0.95, 0.99)
         
         # Log performance results
-        print("\nAPI Response Time Results:")
-        for endpoint, stats in response_times.items():
-            print(f"{endpoint}:")
-            print(f"  Average: {stats['average']:.3f}s")
-            print(f"  95th percentile: {stats['p95']:.3f}s")
-            print(f"  Max: {stats['maximum']:.3f}s")
+        print(f"\nAPI Response Time Results for {method} {endpoint}:")
+        print(f"  Average: {avg_time:.3f}s")
+        print(f"  50th percentile: {p50_time:.3f}s")
+        print(f"  95th percentile: {p95_time:.3f}s")
+        print(f"  99th percentile: {p99_time:.3f}s")
+        print(f"  Max: {max_time:.3f}s")
+        
+        # Assert performance thresholds
+        assert avg_time < self.response_time_threshold, f"{endpoint} average response time too slow: {avg_time:.2f}s"
+        assert p95_time < self.response_time_threshold * 1.5, f"{endpoint} 95th percentile too slow: {p95_time:.2f}s"
     
-    def test_concurrent_request_handling(self):
+    @pytest.mark.usefixtures("perf_notifications")
+    def test_concurrent_request_handling(self, perf_executor):
         """Test handling of concurrent requests."""
-        token = self._get_auth_token("user0@perf-test.com")
-        headers = {"Authorization": f"Bearer {token}"}
-        
         # Test concurrent GET requests
-        def make_request():
+        def make_request(_idx):
             try:
-                start_time = time.time()
-                response = self.client.get("/api/notifications", headers=headers)
-                end_time = time.time()
+                start_ns = time.perf_counter_ns()
+                response = self.client.get("/api/notifications")
+                end_ns = time.perf_counter_ns()
                 
                 return {
                     "status_code": response.status_code,
-                    "response_time": end_time - start_time,
+                    "response_time": (end_ns - start_ns) / 1e9,
                     "success": response.status_code == 200
                 }
             except Exception as e:
@@ -181,9 +254,7 @@ class TestPerformanceValidation:
         
         # Run concurrent requests
         num_concurrent_requests = 20
-        with concurrent.futures.ThreadPoolExecutor(max_workers=num_concurrent_requests) as executor:
-            futures = [executor.submit(make_request) for _ in range(num_concurrent_requests)]
-            results = [future.result() for future in concurrent.futures.as_completed(futures)]
+        results = list(perf_executor.map(make_request, range(num_concurrent_requests)))
         
         # Analyze results
         successful_requests = [r for r in results if r["success"]]
@@ -207,11 +278,11 @@ class TestPerformanceValidation:
         if successful_requests:
             print(f"  Average response time: {avg_response_time:.3f}s")
     
-    def test_database_query_performance(self):
+    @pytest.mark.usefixtures("perf_notifications")
+    def test_database_query_performance(self, mongo_service, perf_executor):
         """Test database query performance."""
-        from api.services.mongodb import MongoDBService
-        
-        mongo_service = MongoDBService()
+        # Warm-up ping so no sample pays for connection setup
+        mongo_service.client.admin.command("ping")
         
         # Test different query patterns
         query_tests = [
@@ -222,28 +293,28 @@ class TestPerformanceValidation:
             ("count_documents", lambda: mongo_service.count_by_org("notifications", self.test_org_id)),
         ]
         
-        query_performance = {}
+        def run_query(task):
+            query_name, query_func = task
+            start_ns = time.perf_counter_ns()
+            result = query_func()
+            return query_name, result, (time.perf_counter_ns() - start_ns) / 1e9
         
-        for query_name, query_func in query_tests:
-            times = []
-            
-            # Run each query multiple times
-            for _ in range(5):
-                start_time = time.time()
-                result = query_func()
-                end_time = time.time()
-                
-                query_time = end_time - start_time
-                times.append(query_time)
-                
-                # Verify query returned results
-                if query_name != "count_documents":
-                    assert result is not None, f"Query {query_name} returned no results"
-                    if isinstance(result, list):
-                        assert len(result) > 0, f"Query {query_name} returned empty list"
-                
-                time.sleep(0.1)
+        # Run each query multiple times, all samples overlapped on the shared pool
+        tasks = [(query_name, query_func) for query_name, query_func in query_tests for _ in range(5)]
+        timings = defaultdict(list)
+        
+        for query_name, result, query_time in perf_executor.map(run_query, tasks):
+            timings[query_name].append(query_time)
             
+            # Verify query returned results
+            if query_name != "count_documents":
+                assert result is not None, f"Query {query_name} returned no results"
+                if isinstance(result, list):
+                    assert len(result) > 0, f"Query {query_name} returned empty list"
+        
+        query_performance = {}
+        
+        for query_name, times in timings.items():
             avg_time = statistics.mean(times)
             max_time = max(times)
             
@@ -260,84 +331,67 @@ class TestPerformanceValidation:
         for query_name, stats in query_performance.items():
             print(f"  {query_name}: {stats['average']:.3f}s avg, {stats['maximum']:.3f}s max")
     
-    def test_pagination_performance(self):
+    @pytest.mark.parametrize("page,limit", [
+        (1, 10),    # First page, small size
+        (1, 50),    # First page, medium size
+        (1, 100),   # First page, large size
+        (10, 20),   # Middle page
+        (50, 20),   # Later page
+    ])
+    @pytest.mark.usefixtures("perf_notifications")
+    def test_pagination_performance(self, page, limit):
         """Test pagination performance with large datasets."""
-        token = self._get_auth_token("user0@perf-test.com")
-        headers = {"Authorization": f"Bearer {token}"}
-        
-        # Test different page sizes and positions
-        pagination_tests = [
-            (1, 10),    # First page, small size
-            (1, 50),    # First page, medium size
-            (1, 100),   # First page, large size
-            (10, 20),   # Middle page
-            (50, 20),   # Later page
-        ]
+        test_name = f"page_{page}_limit_{limit}"
         
-        pagination_performance = {}
+        start_ns = time.perf_counter_ns()
+        response = self.client.get(f"/api/notifications?page={page}&limit={limit}")
+        end_ns = time.perf_counter_ns()
         
-        for page, limit in pagination_tests:
-            test_name = f"page_{page}_limit_{limit}"
-            
-            start_time = time.time()
-            response = self.client.get(
-                f"/api/notifications?page={page}&limit={limit}",
-                headers=headers
-            )
-            end_time = time.time()
-            
-            response_time = end_time - start_time
-            
-            assert response.status_code == 200, f"Pagination request failed: {test_name}"
-            
-            data = response.get_json()
-            assert "_embedded" in data
-            assert "notifications" in data["_embedded"]
-            
-            notifications = data["_embedded"]["notifications"]
-            assert len(notifications) <= limit, f"Returned more items than limit: {test_name}"
-            
-            pagination_performance[test_name] = {
-                "response_time": response_time,
-                "items_returned": len(notifications),
-                "total_items": data.get("total", 0)
-            }
-            
-            # Assert pagination performance
-            assert response_time < 2.0, f"Pagination too slow: {test_name} took {response_time:.3f}s"
+        response_time = (end_ns - start_ns) / 1e9
         
-        print("\nPagination Performance:")
-        for test_name, stats in pagination_performance.items():
-            print(f"  {test_name}: {stats['response_time']:.3f}s, {stats['items_returned']} items")
+        # Body is decoded only after the timed request
+        assert response.status_code == 200, f"Pagination request failed: {test_name}"
+        
+        data = response.get_json()
+        assert "_embedded" in data
+        assert "notifications" in data["_embedded"]
+        
+        notifications = data["_embedded"]["notifications"]
+        assert len(notifications) <= limit, f"Returned more items than limit: {test_name}"
+        
+        print(f"\nPagination Performance: {test_name}: {response_time:.3f}s, {len(notifications)} items")
+        
+        # Assert pagination performance
+        assert response_time < 2.0, f"Pagination too slow: {test_name} took {response_time:.3f}s"
     
+    @pytest.mark.usefixtures("perf_notifications")
     def test_memory_usage_under_load(self):
         """Test memory usage under load."""
-        import psutil
-        import os
-        
         # Get current process
         process = psutil.Process(os.getpid())
         
-        # Measure initial memory usage
-        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
+        def rss_mb():
+            return process.memory_info().rss / 1024 / 1024
         
-        token = self._get_auth_token("user0@perf-test.com")
-        headers = {"Authorization": f"Bearer {token}"}
+        # Measure initial memory usage
+        initial_memory = rss_mb()
         
         # Generate load
         memory_measurements = [initial_memory]
+        failures = 0
         
         for i in range(100):
             # Make request
-            response = self.client.get("/api/notifications?limit=50", headers=headers)
-            assert response.status_code == 200
+            response = self.client.get("/api/notifications?limit=50")
+            failures += response.status_code != 200
             
             # Measure memory every 10 requests
             if i % 10 == 0:
-                current_memory = process.memory_info().rss / 1024 / 1024  # MB
-                memory_measurements.append(current_memory)
+                memory_measurements.append(rss_mb())
+        
+        assert failures == 0, f"{failures} of 100 requests failed under load"
         
-        final_memory = process.memory_info().rss / 1024 / 1024  # MB
+        final_memory = rss_mb()
         max_memory = max(memory_measurements)
         memory_increase = final_memory - initial_memory
         
@@ -351,39 +405,55 @@ class TestPerformanceValidation:
         assert max_memory < self.memory_threshold, f"Memory usage too high: {max_memory:.1f} MB"
         assert memory_increase < 100, f"Memory leak detected: {memory_increase:.1f} MB increase"
     
-    def test_throughput_capacity(self):
+    def test_throughput_capacity(self, perf_executor):
         """Test API throughput capacity."""
-        token = self._get_auth_token("user0@perf-test.com")
-        headers = {"Authorization": f"Bearer {token}"}
+        # Build the request environ once and call the WSGI app directly, so the
+        # test client's per-call request construction stays out of the measurement
+        app = self.client.application
+        health_environ = EnvironBuilder(path="/api/health", headers=dict(self.auth_headers)).get_environ()
         
         # Test throughput for read operations
         def make_read_request():
             try:
-                response = self.client.get("/api/health", headers=headers)
-                return response.status_code == 200
+                status = []
+                body = app(health_environ.copy(), lambda s, h, exc_info=None: status.append(s))
+                try:
+                    for _ in body:
+                        pass
+                finally:
+                    if hasattr(body, "close"):
+                        body.close()
+                return bool(status) and status[0].startswith("200")
             except:
                 return False
         
-        # Measure throughput over a time period
+        def drive_requests(deadline_ns):
+            successful = 0
+            total = 0
+            while time.perf_counter_ns() < deadline_ns:
+                if make_read_request():
+                    successful += 1
+                total += 1
+            return successful, total
+        
+        # Measure throughput over a time period with no client-side throttle,
+        # so the application rather than the harness is the bottleneck
         test_duration = 10  # seconds
-        start_time = time.time()
-        successful_requests = 0
-        total_requests = 0
-        
-        while time.time() - start_time < test_duration:
-            if make_read_request():
-                successful_requests += 1
-            total_requests += 1
-            
-            # Small delay to prevent overwhelming the system
-            time.sleep(0.01)
+        num_workers = 32
+        start_ns = time.perf_counter_ns()
+        deadline_ns = start_ns + test_duration * 1_000_000_000
+        
+        worker_counts = list(perf_executor.map(drive_requests, [deadline_ns] * num_workers))
         
-        actual_duration = time.time() - start_time
+        actual_duration = (time.perf_counter_ns() - start_ns) / 1e9
+        successful_requests = sum(successful for successful, _ in worker_counts)
+        total_requests = sum(total for _, total in worker_counts)
         throughput = successful_requests / actual_duration
         success_rate = successful_requests / total_requests if total_requests > 0 else 0
         
         print(f"\nThroughput Test Results:")
         print(f"  Duration: {actual_duration:.1f}s")
+        print(f"  Workers: {num_workers}")
         print(f"  Total requests: {total_requests}")
         print(f"  Successful requests: {successful_requests}")
         print(f"  Success rate: {success_rate:.2%}")
@@ -395,9 +465,6 @@ class TestPerformanceValidation:
     
     def test_large_payload_handling(self):
         """Test handling of large payloads."""
-        token = self._get_auth_token("user0@perf-test.com")
-        headers = {"Authorization": f"Bearer {token}"}
-        
         # Test different payload sizes
         payload_sizes = [
             (1024, "1KB"),      # 1KB
@@ -414,12 +481,14 @@ class TestPerformanceValidation:
                 "body": large_body,
                 "severity": 2
             }
+            # Encode up front so serialization of the body is not part of the measurement
+            raw_payload = json.dumps(large_notification).encode("utf-8")
             
-            start_time = time.time()
-            response = self.client.post("/api/notifications", json=large_notification, headers=headers)
-            end_time = time.time()
+            start_ns = time.perf_counter_ns()
+            response = self.client.post("/api/notifications", data=raw_payload, content_type="application/json")
+            end_ns = time.perf_counter_ns()
             
-            response_time = end_time - start_time
+            response_time = (end_ns - start_ns) / 1e9
             
             if response.status_code == 201:
                 # Large payload accepted
@@ -432,14 +501,16 @@ class TestPerformanceValidation:
                 # Other error
                 assert False, f"Unexpected response for {size_label} payload: {response.status_code}"
     
-    def test_database_connection_pooling(self):
+    @pytest.mark.usefixtures("perf_notifications")
+    def test_database_connection_pooling(self, mongo_service, perf_executor):
         """Test database connection pooling performance."""
-        from api.services.mongodb import MongoDBService
+        # One service shared by every worker: the MongoClient is thread-safe and pools
+        # its own connections, so the test measures the pool rather than client setup
+        mongo_service.client  # connect and ping before the timed section
         
         # Test multiple concurrent database operations
-        def db_operation():
+        def db_operation(_idx):
             try:
-                mongo_service = MongoDBService()
                 result = mongo_service.find_by_org("notifications", self.test_org_id, limit=10)
                 return len(result) > 0
             except Exception as e:
@@ -448,14 +519,12 @@ class TestPerformanceValidation:
         
         # Run concurrent database operations
         num_concurrent_ops = 20
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=num_concurrent_ops) as executor:
-            futures = [executor.submit(db_operation) for _ in range(num_concurrent_ops)]
-            results = [future.result() for future in concurrent.futures.as_completed(futures)]
+        results = list(perf_executor.map(db_operation, range(num_concurrent_ops)))
         
-        end_time = time.time()
-        total_time = end_time - start_time
+        end_ns = time.perf_counter_ns()
+        total_time = (end_ns - start_ns) / 1e9
         
         successful_ops = sum(results)
         success_rate = successful_ops / len(results)
@@ -471,25 +540,23 @@ class TestPerformanceValidation:
         assert success_rate >= 0.95, f"Database connection pooling success rate too low: {success_rate:.2%}"
         assert total_time < 10.0, f"Concurrent database operations too slow: {total_time:.2f}s"
     
+    @pytest.mark.usefixtures("perf_notifications")
     def test_cache_performance(self):
         """Test caching performance (if implemented)."""
-        token = self._get_auth_token("user0@perf-test.com")
-        headers = {"Authorization": f"Bearer {token}"}
-        
         # Test endpoint that might be cached
         cache_test_endpoint = "/api/notifications?page=1&limit=10"
         
         # First request (cache miss)
-        start_time = time.time()
-        response1 = self.client.get(cache_test_endpoint, headers=headers)
-        first_request_time = time.time() - start_time
+        start_ns = time.perf_counter_ns()
+        response1 = self.client.get(cache_test_endpoint)
+        first_request_time = (time.perf_counter_ns() - start_ns) / 1e9
         
         assert response1.status_code == 200
         
         # Second request (potential cache hit)
-        start_time = time.time()
-        response2 = self.client.get(cache_test_endpoint, headers=headers)
-        second_request_time = time.time() - start_time
+        start_ns = time.perf_counter_ns()
+        response2 = self.client.get(cache_test_endpoint)
+        second_request_time = (time.perf_counter_ns() - start_ns) / 1e9
         
         assert response2.status_code == 200
         
@@ -507,9 +574,6 @@ class TestPerformanceValidation:
     
     def test_error_handling_performance(self):
         """Test that error handling doesn't significantly impact performance."""
-        token = self._get_auth_token("user0@perf-test.com")
-        headers = {"Authorization": f"Bearer {token}"}
-        
         # Test error scenarios
         error_tests = [
             ("/api/notifications/nonexistent", "GET", 404),
@@ -525,17 +589,17 @@ class TestPerformanceValidation:
                 endpoint, method, expected_status, data = test_case
             
             # Measure error response time
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
             if method == "GET":
-                response = self.client.get(endpoint, headers=headers)
+                response = self.client.get(endpoint)
             elif method == "POST":
-                response = self.client.post(endpoint, json=data, headers=headers)
+                response = self.client.post(endpoint, json=data)
             elif method == "PUT":
-                response = self.client.put(endpoint, json=data, headers=headers)
+                response = self.client.put(endpoint, json=data)
             
-            end_time = time.time()
-            response_time = end_time - start_time
+            end_ns = time.perf_counter_ns()
+            response_time = (end_ns - start_ns) / 1e9
             
             assert response.status_code == expected_status
             assert response_time < 1.0, f"Error response too slow: {endpoint} took {response_time:.3f}s"
@@ -552,6 +616,7 @@ class TestScalabilityValidation:
         """Test system behavior with many users."""
         # Create many users and test performance
         num_users = 1000
+        now = datetime.utcnow()
         users = []
         
         for i in range(num_users):
@@ -560,25 +625,20 @@ class TestScalabilityValidation:
                 "organizationId": "scale_test_org",
                 "email": f"user{i}@scale-test.com",
                 "name": f"Scale User {i}",
-                "createdAt": datetime.utcnow(),
+                "createdAt": now,
                 "schemaVersion": 1
             }
             users.append(user)
         
-        # Insert users in batches
-        batch_size = 100
-        start_time = time.time()
-        
-        for i in range(0, len(users), batch_size):
-            batch = users[i:i + batch_size]
-            test_db.users.insert_many(batch)
-        
-        insert_time = time.time() - start_time
+        # Insert users in a single unordered bulk write
+        start_ns = time.perf_counter_ns()
+        test_db.users.insert_many(users, ordered=False)
+        insert_time = (time.perf_counter_ns() - start_ns) / 1e9
         
         # Test querying with many users
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         user_count = test_db.users.count_documents({"organizationId": "scale_test_org"})
-        query_time = time.time() - start_time
+        query_time = (time.perf_counter_ns() - start_ns) / 1e9
         
         assert user_count == num_users
         assert insert_time < 10.0, f"User insertion too slow: {insert_time:.2f}s"
@@ -595,12 +655,12 @@ class TestScalabilityValidation:
         # Implementation would test large numbers of notifications
         pass
     
-    def test_concurrent_user_scalability(self, test_client):
+    def test_concurrent_user_scalability(self, test_client, perf_executor):
         """Test system behavior with many concurrent users."""
         # Simulate many concurrent users
         num_concurrent_users = 50
         
-        def simulate_user_session():
+        def simulate_user_session(_idx):
             try:
                 # Simulate user actions
                 response = test_client.get("/api/health")
@@ -608,14 +668,12 @@ class TestScalabilityValidation:
             except:
                 return False
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=num_concurrent_users) as executor:
-            futures = [executor.submit(simulate_user_session) for _ in range(num_concurrent_users)]
-            results = [future.result() for future in concurrent.futures.as_completed(futures)]
+        results = list(perf_executor.map(simulate_user_session, range(num_concurrent_users)))
         
-        end_time = time.time()
-        total_time = end_time - start_time
+        end_ns = time.perf_counter_ns()
+        total_time = (end_ns - start_ns) / 1e9
         
         successful_sessions = sum(results)
         success_rate = successful_sessions / len(results)
@@ -3,45 +3,249 @@ Production deployment integration tests.
 
 Tests production deployment configuration, external service integrations,
 and production-specific functionality.
+
+The checks are network-bound and independent per service; run them with
+`pytest -n auto --dist=loadgroup` so MongoDB, Redis, AMQP and HTTP groups
+(assigned in conftest.py) execute concurrently. Set SKIP_PRODUCTION_TESTS=1
+to leave this module out of collection entirely; the database, cache and
+broker clients are imported only by the checks that use them.
 """
 
 import pytest
 import os
 import requests
 import time
+from dataclasses import dataclass
 from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
 from typing import Dict, Any, Optional
 import json
-import pymongo
-import redis
-import pika
-from urllib.parse import urlparse
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Transient cold-start failures are retried with exponential backoff on idempotent
+# requests only; 429 is deliberately absent so rate limiting stays observable
+PROBE_RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({'GET', 'HEAD', 'OPTIONS'})
+)
+
+# Expected production contract, shared by the parametrized and set-based checks
+_SECURITY_HEADERS = MappingProxyType({
+    'X-Content-Type-Options': 'nosniff',
+    'X-Frame-Options': 'DENY',
+    'X-XSS-Protection': '1; mode=block',
+    'Referrer-Policy': 'strict-origin-when-cross-origin'
+})
+_EXPECTED_LINKS = frozenset({'notifications', 'organizations', 'audit', 'health'})
+_REQUIRED_CONFIG_FLAGS = frozenset({
+    'mongodb_uri_configured',
+    'redis_configured',
+    'amqp_configured',
+    'jwt_secret_configured'
+})
+
+# Upstash REST pipeline exercising PING/SET/GET/DEL in one round trip
+UPSTASH_PIPELINE_CMDS = [
+    ["PING"],
+    ["SET", "test_key", "test_value"],
+    ["GET", "test_key"],
+    ["DEL", "test_key"],
+]
+
+
+@dataclass(frozen=True)
+class ProdConfig:
+    """Production endpoints and credentials read from the environment."""
+    deployment_url: str
+    mongodb_uri: Optional[str]
+    redis_url: Optional[str]
+    redis_token: Optional[str]
+    amqp_url: Optional[str]
+    jwt_secret: Optional[str]
+    otel_endpoint: Optional[str]
+
+
+@lru_cache(maxsize=1)
+def _config() -> ProdConfig:
+    """Read production configuration once; the environment doesn't change mid-run."""
+    deployment_url = os.getenv('DEPLOYMENT_URL', 'https://sos-cidadao-platform.vercel.app')
+    
+    # Ensure deployment URL has protocol
+    if not deployment_url.startswith(('http://', 'https://')):
+        deployment_url = f'https://{deployment_url}'
+    
+    return ProdConfig(
+        deployment_url=deployment_url.rstrip('/'),  # Remove trailing slash
+        mongodb_uri=os.getenv('MONGODB_URI'),
+        redis_url=os.getenv('REDIS_URL'),
+        redis_token=os.getenv('REDIS_TOKEN'),
+        amqp_url=os.getenv('AMQP_URL'),
+        jwt_secret=os.getenv('JWT_SECRET'),
+        otel_endpoint=os.getenv('OTEL_EXPORTER_OTLP_ENDPOINT')
+    )
+
+
+@pytest.fixture(scope="session")
+def cfg():
+    """Production configuration shared across the session."""
+    return _config()
+
+
+@pytest.fixture(scope="session")
+def http_session():
+    """Keep-alive HTTP session shared by every production check."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=PROBE_RETRY
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def burst_session():
+    """HTTP session without PROBE_RETRY, so each burst request is sent exactly once."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=10)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def deployment_url(cfg):
+    """Deployment base URL with protocol and without trailing slash."""
+    return cfg.deployment_url
+
+
+@pytest.fixture(scope="session")
+def mongo_client(cfg):
+    """MongoDB client shared by every production database check."""
+    if not cfg.mongodb_uri:
+        pytest.skip("MongoDB URI not configured")
+    
+    import pymongo
+    
+    client = pymongo.MongoClient(
+        cfg.mongodb_uri,
+        serverSelectionTimeoutMS=10000,
+        maxPoolSize=10,
+        minPoolSize=2
+    )
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def amqp_channel(cfg):
+    """AMQP channel with publisher confirms, opened once for the session.
+    
+    pika is imported here so runs without AMQP never load it. Every AMQP test
+    shares this one blocking connection; if the suite grows past a couple of
+    AMQP tests, move to a robust aio-pika connection on a session-scoped loop.
+    """
+    if not cfg.amqp_url:
+        pytest.skip("AMQP URL not configured")
+    
+    import pika
+    
+    connection = pika.BlockingConnection(pika.URLParameters(cfg.amqp_url))
+    channel = connection.channel()
+    channel.confirm_delivery()
+    yield channel
+    connection.close()
+
+
+@pytest.fixture(scope="session")
+def redis_pool(cfg):
+    """Redis connection pool built from the full URL, kept for the session."""
+    if not cfg.redis_url or cfg.redis_url.startswith('https://'):
+        pytest.skip("Standard Redis URL not configured")
+    
+    import redis
+    
+    # from_url keeps db, username and TLS (rediss://) settings from the URL
+    pool = redis.ConnectionPool.from_url(
+        cfg.redis_url,
+        max_connections=10,
+        socket_timeout=10,
+        socket_keepalive=True,
+        decode_responses=True
+    )
+    yield pool
+    pool.disconnect()
+
+
+@pytest.fixture(scope="session")
+def root_response(http_session, deployment_url):
+    """Frontend root response fetched once for the header and build checks."""
+    return http_session.get(deployment_url, timeout=30)
+
+
+@pytest.fixture(scope="session")
+def api_root(http_session, deployment_url):
+    """API root response fetched once for the HAL structure and link checks."""
+    response = http_session.get(f"{deployment_url}/api", timeout=30)
+    data = json.loads(response.content) if response.status_code == 200 else None
+    return SimpleNamespace(response=response, data=data)
+
+
+@pytest.fixture(scope="session")
+def health(http_session, deployment_url):
+    """Health endpoint response fetched once for every test that only inspects it."""
+    response = http_session.get(f"{deployment_url}/api/health", timeout=30)
+    # Decode the raw bytes directly, once, for every test sharing the payload
+    data = json.loads(response.content) if response.status_code == 200 else None
+    return SimpleNamespace(response=response, data=data)
+
+
+def _probe_http(http_session, deployment_url):
+    """Return True when the API health endpoint answers 200."""
+    return http_session.get(f"{deployment_url}/api/health", timeout=30).status_code == 200
+
+
+def _probe_mongodb(mongo_client):
+    """Ping MongoDB through the session client."""
+    return mongo_client.admin.command('ping').get('ok') == 1
+
+
+def _probe_redis(redis_pool):
+    """Ping Redis over the wire protocol through the session pool."""
+    import redis
+    
+    return redis.Redis(connection_pool=redis_pool).ping() is True
+
+
+def _probe_redis_rest(http_session, cfg):
+    """Ping Redis over REST (Upstash) through the shared HTTP session."""
+    headers = {'Authorization': f'Bearer {cfg.redis_token}'} if cfg.redis_token else {}
+    response = http_session.post(f"{cfg.redis_url}/pipeline", json=[["PING"]], headers=headers, timeout=10)
+    return response.status_code == 200 and response.json()[0]['result'] == 'PONG'
+
+
+def _probe_amqp(amqp_channel):
+    """Check the session AMQP channel is still open."""
+    return amqp_channel.is_open
 
 
 class TestProductionDeployment:
     """Test production deployment configuration and external services."""
     
-    @pytest.fixture(autouse=True)
-    def setup_production_config(self):
-        """Set up production configuration for testing."""
-        self.deployment_url = os.getenv('DEPLOYMENT_URL', 'https://sos-cidadao-platform.vercel.app')
-        self.mongodb_uri = os.getenv('MONGODB_URI')
-        self.redis_url = os.getenv('REDIS_URL')
-        self.redis_token = os.getenv('REDIS_TOKEN')
-        self.amqp_url = os.getenv('AMQP_URL')
-        self.jwt_secret = os.getenv('JWT_SECRET')
-        self.otel_endpoint = os.getenv('OTEL_EXPORTER_OTLP_ENDPOINT')
-        
-        # Ensure deployment URL has protocol
-        if not self.deployment_url.startswith(('http://', 'https://')):
-            self.deployment_url = f'https://{self.deployment_url}'
-        
-        # Remove trailing slash
-        self.deployment_url = self.deployment_url.rstrip('/')
-    
-    def test_vercel_deployment_accessibility(self):
+    def test_vercel_deployment_accessibility(self, root_response):
         """Test that Vercel deployment is accessible and responsive."""
-        response = requests.get(self.deployment_url, timeout=30)
+        response = root_response
         
         assert response.status_code in [200, 301, 302], f"Deployment not accessible: {response.status_code}"
         
@@ -52,15 +256,14 @@ class TestProductionDeployment:
         if response.status_code == 200:
             assert 'html' in response.text.lower(), "Response doesn't contain HTML"
     
-    def test_api_health_endpoint_production(self):
+    def test_api_health_endpoint_production(self, health):
         """Test API health endpoint in production environment."""
-        health_url = f"{self.deployment_url}/api/health"
-        response = requests.get(health_url, timeout=30)
+        response = health.response
         
         assert response.status_code == 200, f"Health endpoint failed: {response.status_code}"
         assert response.headers.get('content-type') == 'application/hal+json'
         
-        health_data = response.json()
+        health_data = health.data
         
         # Verify health response structure
         assert health_data['status'] == 'healthy'
@@ -88,150 +291,120 @@ class TestProductionDeployment:
             if 'amqp' in dependencies:
                 assert dependencies['amqp']['status'] == 'healthy'
     
-    def test_mongodb_atlas_integration(self):
+    def test_mongodb_atlas_integration(self, mongo_client):
         """Test MongoDB Atlas integration and connectivity."""
-        if not self.mongodb_uri:
-            pytest.skip("MongoDB URI not configured")
+        import pymongo
         
-        # Test connection
-        client = pymongo.MongoClient(self.mongodb_uri, serverSelectionTimeoutMS=10000)
+        # Test server info
+        server_info = mongo_client.server_info()
+        assert 'version' in server_info
         
-        try:
-            # Test server info
-            server_info = client.server_info()
-            assert 'version' in server_info
-            
-            # Test database access
-            db = client.get_default_database()
-            
-            # Test collection operations
-            test_collection = db.test_connection
-            
-            # Insert test document
-            test_doc = {
-                'test': True,
-                'timestamp': datetime.utcnow(),
-                'deployment_test': True
-            }
-            
-            result = test_collection.insert_one(test_doc)
-            assert result.inserted_id is not None
-            
-            # Read test document
-            retrieved_doc = test_collection.find_one({'_id': result.inserted_id})
-            assert retrieved_doc is not None
-            assert retrieved_doc['test'] is True
-            
-            # Clean up test document
-            test_collection.delete_one({'_id': result.inserted_id})
-            
-        finally:
-            client.close()
+        # Test database access
+        db = mongo_client.get_default_database()
+        
+        # Test collection operations
+        test_collection = db.test_connection
+        
+        # Insert and clean up the test document in a single round trip; the
+        # deleted count confirms the write landed and matched
+        test_doc = {
+            'test': True,
+            'timestamp': datetime.utcnow(),
+            'deployment_test': True,
+            'test_marker': uuid.uuid4().hex
+        }
+        
+        result = test_collection.bulk_write([
+            pymongo.InsertOne(test_doc),
+            pymongo.DeleteOne({'test_marker': test_doc['test_marker']})
+        ], ordered=True)
+        
+        assert result.inserted_count == 1
+        assert result.deleted_count == 1
     
-    def test_upstash_redis_integration(self):
+    def test_upstash_redis_integration(self, request, http_session, cfg):
         """Test Upstash Redis integration and connectivity."""
-        if not self.redis_url:
+        if not cfg.redis_url:
             pytest.skip("Redis URL not configured")
         
         # Parse Redis URL for HTTP-based connection (Upstash)
-        if self.redis_url.startswith('https://'):
+        if cfg.redis_url.startswith('https://'):
             # HTTP-based Redis (Upstash)
-            self._test_upstash_http_redis()
+            self._test_upstash_http_redis(http_session, cfg)
         else:
             # Standard Redis connection
-            self._test_standard_redis()
+            self._test_standard_redis(request.getfixturevalue('redis_pool'))
     
-    def _test_upstash_http_redis(self):
+    def _test_upstash_http_redis(self, http_session, cfg):
         """Test Upstash HTTP-based Redis."""
         headers = {}
-        if self.redis_token:
-            headers['Authorization'] = f'Bearer {self.redis_token}'
-        
-        # Test PING command
-        ping_url = f"{self.redis_url}/ping"
-        response = requests.get(ping_url, headers=headers, timeout=10)
-        
-        assert response.status_code == 200
-        assert response.json()['result'] == 'PONG'
-        
-        # Test SET command
-        set_url = f"{self.redis_url}/set/test_key/test_value"
-        response = requests.post(set_url, headers=headers, timeout=10)
-        assert response.status_code == 200
+        if cfg.redis_token:
+            headers['Authorization'] = f'Bearer {cfg.redis_token}'
+        
+        # PING, SET, GET and DEL in a single pipeline request
+        response = http_session.post(
+            f"{cfg.redis_url}/pipeline",
+            json=UPSTASH_PIPELINE_CMDS,
+            headers=headers,
+            timeout=10
+        )
         
-        # Test GET command
-        get_url = f"{self.redis_url}/get/test_key"
-        response = requests.get(get_url, headers=headers, timeout=10)
         assert response.status_code == 200
-        assert response.json()['result'] == 'test_value'
-        
-        # Clean up test key
-        del_url = f"{self.redis_url}/del/test_key"
-        requests.post(del_url, headers=headers, timeout=10)
+        ping_result, set_result, get_result, _ = response.json()
+        assert ping_result['result'] == 'PONG'
+        assert set_result['result'] == 'OK'
+        assert get_result['result'] == 'test_value'
     
-    def _test_standard_redis(self):
+    def _test_standard_redis(self, redis_pool):
         """Test standard Redis connection."""
-        # Parse Redis URL
-        parsed_url = urlparse(self.redis_url)
-        
-        redis_client = redis.Redis(
-            host=parsed_url.hostname,
-            port=parsed_url.port or 6379,
-            password=parsed_url.password,
-            decode_responses=True,
-            socket_timeout=10
-        )
+        import redis
         
-        try:
-            # Test PING
-            assert redis_client.ping() is True
-            
-            # Test SET/GET
-            redis_client.set('test_key', 'test_value', ex=60)
-            assert redis_client.get('test_key') == 'test_value'
-            
-            # Clean up
-            redis_client.delete('test_key')
-            
-        finally:
-            redis_client.close()
+        # Connections come from the session pool, which the fixture owns and disconnects
+        redis_client = redis.Redis(connection_pool=redis_pool)
+        
+        # PING, SET/GET and clean up in a single round trip
+        with redis_client.pipeline(transaction=False) as pipe:
+            pipe.ping()
+            pipe.set('test_key', 'test_value', ex=60)
+            pipe.get('test_key')
+            pipe.delete('test_key')
+            ping_ok, _, value, _ = pipe.execute()
+        
+        assert ping_ok is True
+        assert value == 'test_value'
     
-    def test_cloudamqp_lavinmq_integration(self):
+    def test_cloudamqp_lavinmq_integration(self, amqp_channel):
         """Test CloudAMQP LavinMQ integration and connectivity."""
-        if not self.amqp_url:
-            pytest.skip("AMQP URL not configured")
+        import pika
         
-        # Test AMQP connection
-        connection = pika.BlockingConnection(
-            pika.URLParameters(self.amqp_url)
-        )
+        # Declare a per-run test queue so parallel workers don't share messages
+        test_queue = f'test_deployment_{uuid.uuid4().hex}'
+        amqp_channel.queue_declare(queue=test_queue, durable=False, auto_delete=True)
         
         try:
-            channel = connection.channel()
-            
-            # Declare test queue
-            test_queue = 'test_deployment_queue'
-            channel.queue_declare(queue=test_queue, durable=False, auto_delete=True)
-            
-            # Publish test message
+            # Publish test message; with confirms enabled this returns only once
+            # the broker has routed it, and raises if it could not be delivered
             test_message = json.dumps({
                 'test': True,
                 'timestamp': datetime.utcnow().isoformat(),
                 'deployment_test': True
             })
             
-            channel.basic_publish(
+            amqp_channel.basic_publish(
                 exchange='',
                 routing_key=test_queue,
                 body=test_message,
                 properties=pika.BasicProperties(
                     delivery_mode=1,  # Non-persistent
                     timestamp=int(time.time())
-                )
+                ),
+                mandatory=True
             )
             
             # Consume test message
-            method_frame, header_frame, body = channel.basic_get(queue=test_queue)
+            method_frame, header_frame, body = next(
+                amqp_channel.consume(test_queue, auto_ack=False, inactivity_timeout=1.0)
+            )
             
             assert method_frame is not None, "No message received"
             assert body is not None
@@ -241,21 +414,17 @@ class TestProductionDeployment:
             assert received_message['deployment_test'] is True
             
             # Acknowledge message
-            channel.basic_ack(method_frame.delivery_tag)
-            
-            # Clean up test queue
-            channel.queue_delete(queue=test_queue)
+            amqp_channel.basic_ack(method_frame.delivery_tag)
             
         finally:
-            connection.close()
+            # Stop the consumer and clean up test queue
+            amqp_channel.cancel()
+            amqp_channel.queue_delete(queue=test_queue)
     
-    def test_opentelemetry_observability_production(self):
+    def test_opentelemetry_observability_production(self, health, http_session, cfg):
         """Test OpenTelemetry observability in production environment."""
-        health_url = f"{self.deployment_url}/api/health"
-        response = requests.get(health_url, timeout=30)
-        
-        assert response.status_code == 200
-        health_data = response.json()
+        assert health.response.status_code == 200
+        health_data = health.data
         
         # Check observability configuration
         if 'observability' in health_data:
@@ -265,94 +434,79 @@ class TestProductionDeployment:
             assert observability.get('otel_enabled') is True
             
             # Check if OTLP endpoint is configured
-            if self.otel_endpoint:
+            if cfg.otel_endpoint:
                 # Make a test request to generate traces
-                test_url = f"{self.deployment_url}/api"
-                requests.get(test_url, timeout=30)
+                test_url = f"{cfg.deployment_url}/api"
+                http_session.get(test_url, timeout=30)
                 
                 # Note: We can't directly verify trace export without access to the collector
                 # This would typically be verified through the observability platform
     
-    def test_environment_variables_configuration(self):
+    def test_environment_variables_configuration(self, health):
         """Test that all required environment variables are properly configured."""
-        health_url = f"{self.deployment_url}/api/health"
-        response = requests.get(health_url, timeout=30)
-        
-        assert response.status_code == 200
-        health_data = response.json()
+        assert health.response.status_code == 200
+        health_data = health.data
         
         # Check configuration status
         if 'configuration' in health_data:
             config = health_data['configuration']
             
             # All critical configurations should be present
-            assert config.get('mongodb_uri_configured') is True, "MongoDB URI not configured"
-            assert config.get('redis_configured') is True, "Redis not configured"
-            assert config.get('amqp_configured') is True, "AMQP not configured"
-            assert config.get('jwt_secret_configured') is True, "JWT secret not configured"
+            missing = {flag for flag in _REQUIRED_CONFIG_FLAGS if config.get(flag) is not True}
+            assert not missing, f"Missing configuration: {sorted(missing)}"
             
             # Environment should be production
             assert config.get('environment') == 'production'
     
-    def test_api_endpoints_hal_compliance(self):
+    def test_api_endpoints_hal_compliance(self, api_root):
         """Test that API endpoints return proper HAL responses in production."""
-        # Test API root
-        api_url = f"{self.deployment_url}/api"
-        response = requests.get(api_url, timeout=30)
+        response = api_root.response
         
         assert response.status_code == 200
         assert response.headers.get('content-type') == 'application/hal+json'
         
-        api_data = response.json()
-        
         # Verify HAL structure
-        assert '_links' in api_data
-        assert 'self' in api_data['_links']
-        
-        # Verify major resource links
-        expected_links = ['notifications', 'organizations', 'audit', 'health']
-        for link_rel in expected_links:
-            assert link_rel in api_data['_links'], f"Missing {link_rel} link"
-    
-    def test_security_headers_production(self):
-        """Test that proper security headers are set in production."""
-        response = requests.get(self.deployment_url, timeout=30)
-        
-        headers = response.headers
-        
-        # Check security headers
-        security_headers = {
-            'X-Content-Type-Options': 'nosniff',
-            'X-Frame-Options': 'DENY',
-            'X-XSS-Protection': '1; mode=block',
-            'Referrer-Policy': 'strict-origin-when-cross-origin'
-        }
+        assert '_links' in api_root.data
+        assert 'self' in api_root.data['_links']
+    
+    @pytest.mark.parametrize('link_rel', sorted(_EXPECTED_LINKS))
+    def test_api_root_resource_link(self, api_root, link_rel):
+        """Test that the API root links each major resource."""
+        assert api_root.data is not None, f"API root failed: {api_root.response.status_code}"
+        assert link_rel in api_root.data.get('_links', {}), f"Missing {link_rel} link"
+    
+    @pytest.mark.parametrize('header_name,expected_value', list(_SECURITY_HEADERS.items()))
+    def test_security_header_production(self, root_response, header_name, expected_value):
+        """Test that each security header is set in production."""
+        headers = root_response.headers
         
-        for header_name, expected_value in security_headers.items():
-            assert header_name in headers, f"Missing security header: {header_name}"
-            assert headers[header_name] == expected_value, f"Incorrect {header_name} header value"
+        assert header_name in headers, f"Missing security header: {header_name}"
+        assert headers[header_name] == expected_value, f"Incorrect {header_name} header value"
+    
+    def test_security_transport_production(self, root_response, cfg):
+        """Test that production is served over HTTPS."""
+        headers = root_response.headers
         
         # Check HTTPS
-        assert self.deployment_url.startswith('https://'), "Deployment should use HTTPS"
+        assert cfg.deployment_url.startswith('https://'), "Deployment should use HTTPS"
         
         # Check for HSTS header (may be set by Vercel)
         if 'Strict-Transport-Security' in headers:
             assert 'max-age=' in headers['Strict-Transport-Security']
     
-    def test_api_rate_limiting_production(self):
+    def test_api_rate_limiting_production(self, burst_session, cfg):
         """Test API rate limiting in production environment."""
-        health_url = f"{self.deployment_url}/api/health"
+        health_url = f"{cfg.deployment_url}/api/health"
         
-        # Make multiple rapid requests
-        responses = []
-        for i in range(10):
+        def fetch_status(_):
             try:
-                response = requests.get(health_url, timeout=5)
-                responses.append(response.status_code)
+                return burst_session.get(health_url, timeout=5).status_code
             except requests.RequestException:
-                responses.append(0)
-            
-            time.sleep(0.1)  # Small delay between requests
+                return 0
+        
+        # Fire the requests as one concurrent burst so a rate limiter can actually trip
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            responses = list(executor.map(fetch_status, range(10)))
         
         # Most requests should succeed
         success_count = sum(1 for status in responses if status == 200)
@@ -362,15 +516,15 @@ class TestProductionDeployment:
         rate_limited = any(status == 429 for status in responses)
         if rate_limited:
             # Make one more request to check rate limiting headers
-            response = requests.get(health_url, timeout=5)
+            response = burst_session.get(health_url, timeout=5)
             if response.status_code == 429:
                 assert 'Retry-After' in response.headers
     
-    def test_error_handling_production(self):
+    def test_error_handling_production(self, http_session, cfg):
         """Test error handling in production environment."""
         # Test 404 error
-        not_found_url = f"{self.deployment_url}/api/nonexistent-endpoint"
-        response = requests.get(not_found_url, timeout=30)
+        not_found_url = f"{cfg.deployment_url}/api/nonexistent-endpoint"
+        response = http_session.get(not_found_url, timeout=30)
         
         assert response.status_code == 404
         
@@ -380,9 +534,9 @@ class TestProductionDeployment:
             assert '_links' in error_data
             assert 'self' in error_data['_links']
     
-    def test_frontend_production_build(self):
+    def test_frontend_production_build(self, root_response):
         """Test that frontend is properly built and served in production."""
-        response = requests.get(self.deployment_url, timeout=30)
+        response = root_response
         
         assert response.status_code == 200
         
@@ -400,12 +554,12 @@ class TestProductionDeployment:
         assert '<meta' in html_content
         assert 'viewport' in html_content
     
-    def test_cors_configuration_production(self):
+    def test_cors_configuration_production(self, http_session, cfg):
         """Test CORS configuration in production."""
-        api_url = f"{self.deployment_url}/api"
+        api_url = f"{cfg.deployment_url}/api"
         
         # Test preflight request
-        response = requests.options(
+        response = http_session.options(
             api_url,
             headers={
                 'Origin': 'https://example.com',
@@ -419,21 +573,22 @@ class TestProductionDeployment:
         # The exact behavior depends on the CORS configuration
         assert response.status_code in [200, 204, 405]  # Various valid responses
     
-    def test_performance_production(self):
+    def test_performance_production(self, http_session, cfg):
         """Test performance characteristics in production."""
-        health_url = f"{self.deployment_url}/api/health"
+        health_url = f"{cfg.deployment_url}/api/health"
+        
+        # Warm-up request primes the pooled TLS connection so samples reflect steady state
+        http_session.get(health_url, timeout=30)
+        
+        # Measure response times concurrently; elapsed spans send to response
+        # headers, so client-side overhead stays out of the samples
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            responses = list(executor.map(lambda _: http_session.get(health_url, timeout=30), range(5)))
         
-        # Measure response times
         response_times = []
-        for i in range(5):
-            start_time = time.time()
-            response = requests.get(health_url, timeout=30)
-            end_time = time.time()
-            
+        for response in responses:
             assert response.status_code == 200
-            response_times.append(end_time - start_time)
-            
-            time.sleep(1)  # Wait between requests
+            response_times.append(response.elapsed.total_seconds())
         
         # Calculate average response time
         avg_response_time = sum(response_times) / len(response_times)
@@ -449,83 +604,90 @@ class TestProductionDeployment:
 class TestProductionDataIntegrity:
     """Test data integrity and consistency in production environment."""
     
-    def test_database_indexes_production(self):
+    def test_database_indexes_production(self, mongo_client):
         """Test that proper database indexes are created in production."""
-        mongodb_uri = os.getenv('MONGODB_URI')
-        if not mongodb_uri:
-            pytest.skip("MongoDB URI not configured")
+        db = mongo_client.get_default_database()
         
-        client = pymongo.MongoClient(mongodb_uri, serverSelectionTimeoutMS=10000)
+        # Check indexes on critical collections; list collections once, then
+        # fetch the index specs of the existing ones in parallel
+        collections_to_check = ['notifications', 'users', 'organizations', 'audit_logs']
+        existing = set(db.list_collection_names())
+        names = [name for name in collections_to_check if name in existing]
         
-        try:
-            db = client.get_default_database()
+        if not names:
+            return
+        
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            index_map = dict(zip(names, executor.map(lambda name: list(db[name].list_indexes()), names)))
+        
+        for collection_name, indexes in index_map.items():
+            # Should have at least _id index
+            assert len(indexes) >= 1
             
-            # Check indexes on critical collections
-            collections_to_check = ['notifications', 'users', 'organizations', 'audit_logs']
+            # Check for organization scoping index
+            org_index_found = any(
+                'organizationId' in idx.get('key', {})
+                for idx in indexes
+            )
             
-            for collection_name in collections_to_check:
-                if collection_name in db.list_collection_names():
-                    collection = db[collection_name]
-                    indexes = list(collection.list_indexes())
-                    
-                    # Should have at least _id index
-                    assert len(indexes) >= 1
-                    
-                    # Check for organization scoping index
-                    org_index_found = any(
-                        'organizationId' in idx.get('key', {})
-                        for idx in indexes
-                    )
-                    
-                    if collection_name != 'organizations':
-                        assert org_index_found, f"Missing organizationId index on {collection_name}"
-        
-        finally:
-            client.close()
+            if collection_name != 'organizations':
+                assert org_index_found, f"Missing organizationId index on {collection_name}"
     
-    def test_data_migration_status(self):
+    def test_data_migration_status(self, mongo_client):
         """Test that data migrations have been applied in production."""
-        mongodb_uri = os.getenv('MONGODB_URI')
-        if not mongodb_uri:
-            pytest.skip("MongoDB URI not configured")
-        
-        client = pymongo.MongoClient(mongodb_uri, serverSelectionTimeoutMS=10000)
+        db = mongo_client.get_default_database()
         
-        try:
-            db = client.get_default_database()
+        # Check for migration tracking collection
+        if 'migrations' in db.list_collection_names():
+            migrations = db.migrations
+            applied_migrations = list(migrations.find({}))
             
-            # Check for migration tracking collection
-            if 'migrations' in db.list_collection_names():
-                migrations = db.migrations
-                applied_migrations = list(migrations.find({}))
-                
-                # Should have some migrations applied
-                assert len(applied_migrations) > 0, "No migrations found"
-                
-                # Check that migrations have proper structure
-                for migration in applied_migrations:
-                    assert 'name' in migration
-                    assert 'applied_at' in migration
-                    assert 'version' in migration
-        
-        finally:
-            client.close()
+            # Should have some migrations applied
+            assert len(applied_migrations) > 0, "No migrations found"
+            
+            # Check that migrations have proper structure
+            for migration in applied_migrations:
+                assert 'name' in migration
+                assert 'applied_at' in migration
+                assert 'version' in migration
 
 
 class TestProductionMonitoring:
     """Test production monitoring and observability."""
     
-    def test_health_check_comprehensive(self):
-        """Test comprehensive health check in production."""
-        deployment_url = os.getenv('DEPLOYMENT_URL', 'https://sos-cidadao-platform.vercel.app')
-        if not deployment_url.startswith(('http://', 'https://')):
-            deployment_url = f'https://{deployment_url}'
-        
-        health_url = f"{deployment_url.rstrip('/')}/api/health"
-        response = requests.get(health_url, timeout=30)
+    def test_all_services_reachable(self, request, cfg, http_session, deployment_url):
+        """Probe every external service concurrently as a single smoke check."""
+        probes = {'http': partial(_probe_http, http_session, deployment_url)}
+        
+        # Session fixtures are resolved here on the main thread, and only for
+        # configured services so an absent one doesn't skip the whole check
+        if cfg.mongodb_uri:
+            probes['mongodb'] = partial(_probe_mongodb, request.getfixturevalue('mongo_client'))
+        if cfg.redis_url and cfg.redis_url.startswith('https://'):
+            probes['redis'] = partial(_probe_redis_rest, http_session, cfg)
+        elif cfg.redis_url:
+            probes['redis'] = partial(_probe_redis, request.getfixturevalue('redis_pool'))
+        if cfg.amqp_url:
+            probes['amqp'] = partial(_probe_amqp, request.getfixturevalue('amqp_channel'))
+        
+        # Wall time is the slowest probe rather than the sum of all of them
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            futures = {name: executor.submit(probe) for name, probe in probes.items()}
+        
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                results[name] = e
         
-        assert response.status_code == 200
-        health_data = response.json()
+        failed = {name: result for name, result in results.items() if result is not True}
+        assert not failed, f"Unreachable services: {failed}"
+    
+    def test_health_check_comprehensive(self, health):
+        """Test comprehensive health check in production."""
+        assert health.response.status_code == 200
+        health_data = health.data
         
         # Verify comprehensive health information
         assert 'status' in health_data
@@ -546,14 +708,10 @@ class TestProductionMonitoring:
                 if service_name in ['mongodb', 'redis']:
                     assert service_health['status'] == 'healthy', f"{service_name} is not healthy"
     
-    def test_metrics_endpoint(self):
+    def test_metrics_endpoint(self, http_session, deployment_url):
         """Test metrics endpoint if available."""
-        deployment_url = os.getenv('DEPLOYMENT_URL', 'https://sos-cidadao-platform.vercel.app')
-        if not deployment_url.startswith(('http://', 'https://')):
-            deployment_url = f'https://{deployment_url}'
-        
-        metrics_url = f"{deployment_url.rstrip('/')}/api/metrics"
-        response = requests.get(metrics_url, timeout=30)
+        metrics_url = f"{deployment_url}/api/metrics"
+        response = http_session.get(metrics_url, timeout=30)
         
         # Metrics endpoint might not be publicly available
         if response.status_code == 200:
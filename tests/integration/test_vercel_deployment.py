@@ -4,104 +4,253 @@ Tests deployment configuration, serverless function setup, and environment handl
 """
 
 import os
-import json
+import sys
+import subprocess
 import pytest
 import requests
-from unittest.mock import patch, MagicMock
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
+from typing import Annotated, Dict, List, Literal
+from pydantic import BaseModel, ConfigDict, Field
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Separate (connect, read) budgets so an unreachable host fails fast while a
+# slow-but-connected serverless response still gets its full read window
+TIMEOUT = (3.05, 10)
+WARMUP_TIMEOUT = (3.05, 15)
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({'GET', 'HEAD', 'OPTIONS'})
+)
+
+# vercel.json entries that each get their own test case
+REQUIRED_ENV_VARS = (
+    'ENVIRONMENT',
+    'MONGODB_URI',
+    'REDIS_URL',
+    'JWT_SECRET',
+    'AMQP_URL'
+)
+SECURITY_HEADERS = (
+    'X-Content-Type-Options',
+    'X-Frame-Options',
+    'X-XSS-Protection',
+    'Referrer-Policy'
+)
+
+# Statuses a CORS preflight may legitimately answer with
+_CORS_OK = frozenset({200, 204})
+
+# Read-only deployment probes as name -> (method, path, extra request kwargs)
+DEPLOYMENT_PROBES = {
+    'health': ('GET', '/api/healthz', {}),
+    # Frontend checks only read status and headers, so skip the HTML body
+    'frontend': ('HEAD', '', {'allow_redirects': True}),
+    'cors': ('OPTIONS', '/api/healthz', {
+        'headers': {
+            'Origin': 'https://example.com',
+            'Access-Control-Request-Method': 'GET'
+        }
+    })
+}
+
+# Deployment probes only run against a live instance
+DEPLOYMENT_URL = os.environ.get('DEPLOYMENT_URL')
+_requires_deployment = pytest.mark.skipif(not DEPLOYMENT_URL, reason="No deployment URL provided")
+
+# Cold-start budget for importing the serverless entry point, in microseconds
+IMPORT_TIME_BUDGET_US = 2_000_000
+
+# Service endpoints withheld from the cold-start import so it never dials out;
+# in production mode the Redis client stays disabled without REDIS_URL
+_SERVICE_ENV_VARS = frozenset({
+    'MONGODB_URI',
+    'REDIS_URL',
+    'REDIS_TOKEN',
+    'AMQP_URL',
+    'OTEL_EXPORTER_OTLP_ENDPOINT'
+})
+
+
+class VercelFunction(BaseModel):
+    """Serverless function settings."""
+    
+    model_config = ConfigDict(strict=True)
+    
+    runtime: Literal['python3.11']
+    maxDuration: int = Field(..., le=30, description="Vercel limit is 30 seconds")
+
+
+class VercelRoute(BaseModel):
+    """Route mapping a source pattern to a destination."""
+    
+    model_config = ConfigDict(strict=True)
+    
+    src: str
+    dest: str = ''
+
+
+class VercelHeader(BaseModel):
+    """Single response header."""
+    
+    model_config = ConfigDict(strict=True)
+    
+    key: str
+    value: str
+
+
+class VercelHeaderRule(BaseModel):
+    """Headers applied to a source pattern."""
+    
+    model_config = ConfigDict(strict=True)
+    
+    source: str
+    headers: List[VercelHeader]
+
+
+class VercelBuild(BaseModel):
+    """Build-time settings."""
+    
+    model_config = ConfigDict(strict=True)
+    
+    env: Dict[str, str]
+
+
+class VercelConfig(BaseModel):
+    """Shape of vercel.json that the deployment relies on."""
+    
+    model_config = ConfigDict(strict=True)
+    
+    functions: Dict[str, VercelFunction]
+    routes: List[VercelRoute] = Field(..., min_length=1)
+    # A Vercel secret reference (starting with @) must name a secret
+    env: Dict[str, Annotated[str, Field(pattern=r'^([^@].*|@.+)?$')]]
+    headers: List[VercelHeaderRule]
+    build: VercelBuild
+    buildCommand: str
+    outputDirectory: str
+    installCommand: str
+
+
+@pytest.fixture(scope="session")
+def http_session():
+    """Keep-alive HTTP session shared by the deployment probes."""
+    session = requests.Session()
+    session.headers['Connection'] = 'keep-alive'
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=RETRY
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def _warm_deployment(http_session):
+    """Absorb the serverless cold start before any probe or timing runs."""
+    # First hit pays container provisioning and imports; any outcome is fine,
+    # including exhausting the gateway-error retries
+    try:
+        http_session.get(f"{DEPLOYMENT_URL}/api/healthz", timeout=WARMUP_TIMEOUT)
+    except requests.RequestException:
+        pass
+    response = http_session.get(f"{DEPLOYMENT_URL}/api/healthz", timeout=WARMUP_TIMEOUT)
+    assert response.status_code == 200, f"Deployment not healthy after warm-up: {response.status_code}"
+
+
+@pytest.fixture(scope="session")
+def deployment_probes(http_session, _warm_deployment):
+    """Read-only deployment responses, fetched concurrently once per session."""
+    def probe(item):
+        name, (method, path, kwargs) = item
+        return name, http_session.request(method, f"{DEPLOYMENT_URL}{path}", timeout=TIMEOUT, **kwargs)
+    
+    # One worker per probe so the whole batch is bounded by the slowest response
+    with ThreadPoolExecutor(max_workers=len(DEPLOYMENT_PROBES)) as executor:
+        return dict(executor.map(probe, DEPLOYMENT_PROBES.items()))
+
+
+@pytest.fixture(scope="session")
+def header_keys(vercel_config):
+    """Every header key configured in vercel.json."""
+    return frozenset(chain.from_iterable(
+        (header['key'] for header in header_config.get('headers', ()))
+        for header_config in vercel_config.get('headers', ())
+    ))
+
+
+@pytest.fixture(scope="session")
+def route_index(vercel_config):
+    """vercel.json routes bucketed by category in a single pass."""
+    api_routes, health_routes, fallback_routes = [], [], []
+    for route in vercel_config.get('routes', ()):
+        src = route['src']
+        if src.startswith('/api'):
+            api_routes.append(route)
+        if '/healthz' in src:
+            health_routes.append(route)
+        if route.get('dest') == '/index.html':
+            fallback_routes.append(route)
+    return {'api': api_routes, 'healthz': health_routes, 'fallback': fallback_routes}
 
 
 class TestVercelDeploymentConfiguration:
     """Test Vercel deployment configuration."""
     
-    @pytest.fixture
-    def vercel_config(self):
-        """Load Vercel configuration."""
-        project_root = Path(__file__).parent.parent.parent
-        vercel_file = project_root / 'vercel.json'
-        
-        with open(vercel_file, 'r') as f:
-            return json.load(f)
+    def test_config_schema(self, vercel_config):
+        """Test that vercel.json matches the shape the deployment relies on."""
+        VercelConfig.model_validate(dict(vercel_config))
     
     def test_serverless_function_configuration(self, vercel_config):
         """Test serverless function configuration."""
         functions = vercel_config.get('functions', {})
-        
-        # Verify Python runtime configuration
         assert 'api/**/*.py' in functions
-        python_config = functions['api/**/*.py']
         
-        assert python_config['runtime'] == 'python3.11'
-        assert 'maxDuration' in python_config
-        assert python_config['maxDuration'] <= 30  # Vercel limit
+        # Runtime and maxDuration limits are enforced by VercelFunction
+        VercelFunction.model_validate(functions['api/**/*.py'])
     
-    def test_routing_configuration(self, vercel_config):
+    def test_routing_configuration(self, route_index):
         """Test API routing configuration."""
-        routes = vercel_config.get('routes', [])
-        
         # Verify API routes are configured
-        api_routes = [route for route in routes if route['src'].startswith('/api')]
-        assert len(api_routes) > 0
+        assert len(route_index['api']) > 0
         
         # Verify health check route
-        health_routes = [route for route in routes if '/healthz' in route['src']]
-        assert len(health_routes) > 0
+        assert len(route_index['healthz']) > 0
         
         # Verify frontend fallback
-        fallback_routes = [route for route in routes if route['dest'] == '/index.html']
-        assert len(fallback_routes) > 0
+        assert len(route_index['fallback']) > 0
     
-    def test_environment_variables_configuration(self, vercel_config):
+    @pytest.mark.parametrize('var', REQUIRED_ENV_VARS)
+    def test_environment_variables_configuration(self, vercel_config, var):
         """Test environment variables configuration."""
         env_vars = vercel_config.get('env', {})
+        assert var in env_vars, f"Missing env var: {var}"
         
-        required_vars = [
-            'ENVIRONMENT',
-            'MONGODB_URI',
-            'REDIS_URL',
-            'JWT_SECRET',
-            'AMQP_URL'
-        ]
-        
-        for var in required_vars:
-            assert var in env_vars
-            # Verify it's using Vercel secrets (starts with @)
-            if env_vars[var].startswith('@'):
-                assert len(env_vars[var]) > 1  # Not just @
+        # A Vercel secret reference (starting with @) must name a secret
+        assert env_vars[var] != '@', f"{var} references an unnamed secret"
     
-    def test_security_headers_configuration(self, vercel_config):
+    @pytest.mark.parametrize('header', SECURITY_HEADERS)
+    def test_security_headers_configuration(self, header_keys, header):
         """Test security headers configuration."""
-        headers = vercel_config.get('headers', [])
-        
-        # Collect all configured headers
-        all_headers = []
-        for header_config in headers:
-            for header in header_config.get('headers', []):
-                all_headers.append(header['key'])
-        
-        # Verify security headers
-        security_headers = [
-            'X-Content-Type-Options',
-            'X-Frame-Options',
-            'X-XSS-Protection',
-            'Referrer-Policy'
-        ]
-        
-        for header in security_headers:
-            assert header in all_headers
+        assert header in header_keys, f"Missing security header: {header}"
     
     def test_build_configuration(self, vercel_config):
         """Test build configuration."""
-        build_config = vercel_config.get('build', {})
-        
-        # Verify build environment
-        build_env = build_config.get('env', {})
-        assert 'ENVIRONMENT' in build_env
+        for key in ('buildCommand', 'outputDirectory', 'installCommand'):
+            assert key in vercel_config, f"Missing build setting: {key}"
         
-        # Verify build commands are configured
-        assert 'buildCommand' in vercel_config
-        assert 'outputDirectory' in vercel_config
-        assert 'installCommand' in vercel_config
+        build = VercelBuild.model_validate(vercel_config.get('build', {}))
+        assert 'ENVIRONMENT' in build.env
 
 
 class TestServerlessFunctionBehavior:
@@ -109,37 +258,67 @@ class TestServerlessFunctionBehavior:
     
     def test_cold_start_optimization(self):
         """Test that functions are optimized for cold starts."""
-        # This would test import time, connection pooling, etc.
-        # For now, just verify the vercel_app.py exists
-        project_root = Path(__file__).parent.parent.parent
-        vercel_app_file = project_root / 'api' / 'vercel_app.py'
+        api_dir = PROJECT_ROOT / 'api'
+        assert (api_dir / 'vercel_app.py').exists()
+        
+        env = {key: value for key, value in os.environ.items() if key not in _SERVICE_ENV_VARS}
+        env.update(ENVIRONMENT='production', OTEL_ENABLED='false')
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+        
+        # Import the entry point in a fresh interpreter, as a cold start would,
+        # so modules already loaded by this test session don't hide the cost.
+        # The first run may spend its time compiling bytecode, so only the
+        # second, cache-warm run is measured.
+        for _ in range(2):
+            result = subprocess.run(
+                [sys.executable, '-X', 'importtime', '-c', 'import vercel_app'],
+                cwd=api_dir,
+                env=env,
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+        assert result.returncode == 0, f"vercel_app failed to import:\n{result.stderr[-2000:]}"
         
-        assert vercel_app_file.exists()
+        # Lines look like "import time:  <self us> | <cumulative us> | <module>"
+        imports = []
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:'):
+                continue
+            self_us, _, module = line[len('import time:'):].split('|')
+            if self_us.strip().isdigit():
+                imports.append((int(self_us), module.strip()))
+        
+        total_us = sum(self_us for self_us, _ in imports)
+        heaviest = sorted(imports, reverse=True)[:10]
+        assert total_us < IMPORT_TIME_BUDGET_US, (
+            f"vercel_app import took {total_us} us (budget {IMPORT_TIME_BUDGET_US} us); "
+            f"heaviest imports: {heaviest}"
+        )
     
+    @pytest.mark.skip(reason="pending implementation")
     def test_connection_pooling_configuration(self):
         """Test connection pooling for serverless environment."""
         # Verify MongoDB and Redis connections are configured for serverless
         pass
     
+    @pytest.mark.skip(reason="pending implementation")
     def test_environment_variable_handling(self):
         """Test environment variable handling in serverless functions."""
         # Test that environment variables are properly loaded
         pass
 
 
+@pytest.mark.usefixtures("_warm_deployment")
 class TestDeploymentValidation:
     """Test deployment validation functionality."""
     
     @pytest.mark.integration
-    def test_health_endpoint_accessibility(self):
+    @_requires_deployment
+    def test_health_endpoint_accessibility(self, deployment_probes):
         """Test that health endpoint is accessible after deployment."""
         # This would be run against a deployed instance
-        # Skip if no deployment URL is provided
-        deployment_url = os.environ.get('DEPLOYMENT_URL')
-        if not deployment_url:
-            pytest.skip("No deployment URL provided")
-        
-        response = requests.get(f"{deployment_url}/api/healthz", timeout=10)
+        response = deployment_probes['health']
         assert response.status_code == 200
         
         data = response.json()
@@ -147,44 +326,28 @@ class TestDeploymentValidation:
         assert data['status'] == 'healthy'
     
     @pytest.mark.integration
-    def test_frontend_accessibility(self):
+    @_requires_deployment
+    def test_frontend_accessibility(self, deployment_probes):
         """Test that frontend is accessible after deployment."""
-        deployment_url = os.environ.get('DEPLOYMENT_URL')
-        if not deployment_url:
-            pytest.skip("No deployment URL provided")
-        
-        response = requests.get(deployment_url, timeout=10)
+        response = deployment_probes['frontend']
         assert response.status_code == 200
         assert 'text/html' in response.headers.get('content-type', '')
     
     @pytest.mark.integration
-    def test_api_cors_configuration(self):
+    @_requires_deployment
+    def test_api_cors_configuration(self, deployment_probes):
         """Test CORS configuration in deployed environment."""
-        deployment_url = os.environ.get('DEPLOYMENT_URL')
-        if not deployment_url:
-            pytest.skip("No deployment URL provided")
-        
-        # Test preflight request
-        response = requests.options(
-            f"{deployment_url}/api/healthz",
-            headers={
-                'Origin': 'https://example.com',
-                'Access-Control-Request-Method': 'GET'
-            },
-            timeout=10
-        )
+        # Preflight request
+        response = deployment_probes['cors']
         
         # Should handle CORS preflight
-        assert response.status_code in [200, 204]
+        assert response.status_code in _CORS_OK
     
     @pytest.mark.integration
-    def test_security_headers_in_deployment(self):
+    @_requires_deployment
+    def test_security_headers_in_deployment(self, deployment_probes):
         """Test security headers in deployed environment."""
-        deployment_url = os.environ.get('DEPLOYMENT_URL')
-        if not deployment_url:
-            pytest.skip("No deployment URL provided")
-        
-        response = requests.get(deployment_url, timeout=10)
+        response = deployment_probes['frontend']
         
         # Verify security headers
         headers = response.headers
@@ -193,13 +356,10 @@ class TestDeploymentValidation:
         assert 'X-XSS-Protection' in headers
     
     @pytest.mark.integration
-    def test_api_response_format(self):
+    @_requires_deployment
+    def test_api_response_format(self, deployment_probes):
         """Test API response format in deployed environment."""
-        deployment_url = os.environ.get('DEPLOYMENT_URL')
-        if not deployment_url:
-            pytest.skip("No deployment URL provided")
-        
-        response = requests.get(f"{deployment_url}/api/healthz", timeout=10)
+        response = deployment_probes['health']
         assert response.status_code == 200
         
         # Verify HAL format
@@ -208,48 +368,38 @@ class TestDeploymentValidation:
         assert 'self' in data['_links']
     
     @pytest.mark.integration
-    def test_performance_benchmarks(self):
+    @_requires_deployment
+    def test_performance_benchmarks(self, http_session):
         """Test performance benchmarks in deployed environment."""
-        deployment_url = os.environ.get('DEPLOYMENT_URL')
-        if not deployment_url:
-            pytest.skip("No deployment URL provided")
-        
         import time
         
-        # Test response time
-        start_time = time.time()
-        response = requests.get(f"{deployment_url}/api/healthz", timeout=10)
-        end_time = time.time()
-        
-        response_time = (end_time - start_time) * 1000  # Convert to milliseconds
+        # Test warm response time
+        start_ns = time.perf_counter_ns()
+        response = http_session.get(f"{DEPLOYMENT_URL}/api/healthz", timeout=TIMEOUT)
+        elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         
         assert response.status_code == 200
-        assert response_time < 5000  # Should respond within 5 seconds
+        assert elapsed_ms < 2000  # Warm instance should respond within 2 seconds
 
 
 class TestEnvironmentSpecificBehavior:
     """Test environment-specific deployment behavior."""
     
+    @pytest.mark.skip(reason="pending implementation")
     def test_production_environment_configuration(self):
         """Test production environment configuration."""
-        with patch.dict(os.environ, {
-            'ENVIRONMENT': 'production',
-            'DOCS_ENABLED': 'false',
-            'OTEL_ENABLED': 'true'
-        }):
-            # Test that production configuration is applied
-            pass
+        # Test that production configuration is applied
+        # (ENVIRONMENT=production, DOCS_ENABLED=false, OTEL_ENABLED=true)
+        pass
     
+    @pytest.mark.skip(reason="pending implementation")
     def test_preview_environment_configuration(self):
         """Test preview environment configuration."""
-        with patch.dict(os.environ, {
-            'ENVIRONMENT': 'preview',
-            'DOCS_ENABLED': 'true',
-            'OTEL_ENABLED': 'true'
-        }):
-            # Test that preview configuration is applied
-            pass
+        # Test that preview configuration is applied
+        # (ENVIRONMENT=preview, DOCS_ENABLED=true, OTEL_ENABLED=true)
+        pass
     
+    @pytest.mark.skip(reason="pending implementation")
     def test_error_handling_in_production(self):
         """Test error handling in production environment."""
         # Test that errors are properly handled and don't expose sensitive info
@@ -259,16 +409,19 @@ class TestEnvironmentSpecificBehavior:
 class TestContinuousDeployment:
     """Test continuous deployment functionality."""
     
+    @pytest.mark.skip(reason="pending implementation")
     def test_deployment_rollback_capability(self):
         """Test deployment rollback capability."""
         # This would test Vercel's rollback functionality
         pass
     
+    @pytest.mark.skip(reason="pending implementation")
     def test_preview_deployment_isolation(self):
         """Test that preview deployments are isolated."""
         # Test that preview deployments don't affect production
         pass
     
+    @pytest.mark.skip(reason="pending implementation")
     def test_environment_variable_management(self):
         """Test environment variable management across deployments."""
         # Test that environment variables are properly managed